@@ -2,9 +2,14 @@
 This module provides a base handler with some useful methods for all REST API handlers.
 """
 from typing import Any
+import io
 import falcon
 
-from ..serialization import my_load_from_json, my_to_json
+from ..serialization import my_load_from_json, my_to_json_bytes
+
+# JSON responses of at least this size (in bytes) are streamed instead of
+# being buffered again by the server
+STREAM_RESPONSE_THRESHOLD = 1024 * 1024
 
 
 class BaseHandler():
@@ -64,6 +69,25 @@ class BaseHandler():
             Loaded object.
         """
         try:
+            content_length = req.content_length
+            if content_length:
+                # Read the body in chunks into a preallocated buffer instead
+                # of building one large bytes object from many concatenations
+                buf = bytearray(content_length)
+                view = memoryview(buf)
+                pos = 0
+                while pos < content_length:
+                    chunk = req.bounded_stream.read(
+                        min(65536, content_length - pos))
+                    if not chunk:
+                        break
+                    view[pos:pos + len(chunk)] = chunk
+                    pos += len(chunk)
+                view.release()
+                del buf[pos:]
+
+                return my_load_from_json(buf)
+
             return my_load_from_json(req.bounded_stream.read())
         except Exception:
             return None
@@ -79,6 +103,14 @@ class BaseHandler():
         data : `Any`
             Data to be sent.
         """
+        payload = my_to_json_bytes(data)
+
         resp.content_type = falcon.MEDIA_JSON
         resp.status = falcon.HTTP_200
-        resp.data = my_to_json(data).encode()
+        if len(payload) < STREAM_RESPONSE_THRESHOLD:
+            resp.data = payload
+        else:
+            # Let falcon stream large payloads (e.g. SCADA data exports)
+            # out in chunks instead of copying them once more
+            resp.content_length = len(payload)
+            resp.stream = io.BytesIO(payload)
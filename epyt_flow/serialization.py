@@ -13,6 +13,11 @@ import numpy as np
 import networkx
 import scipy
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 SCIPY_BSRARRAY_ID                       = -3
 NETWORKX_GRAPH_ID                       = -2
@@ -227,10 +232,30 @@ class Serializable(ABC):
         return save_to_file(f_out, self, use_zip)
 
 
+def _json_serialize_default(obj_: Any) -> Any:
+    """
+    Default handler for serializing objects that are not natively
+    supported by JSON -- e.g. instances of
+    :class:`~epyt_flow.serialization.JsonSerializable`.
+    """
+    if isinstance(obj_, JsonSerializable):
+        my_class_name = (obj_.__module__, obj_.__class__.__name__)
+        return obj_.get_attributes() | {"__type__": my_class_name}
+    elif isinstance(obj_, np.ndarray):
+        return obj_.tolist()
+    elif isinstance(obj_, tuple):
+        return list(obj_)
+    else:
+        return obj_
+
+
 def my_to_json(obj: Any) -> str:
     """
     Serializes a given object to JSON.
 
+    Uses `orjson <https://github.com/ijl/orjson>`_ if available --
+    falls back to the Python standard library otherwise.
+
     Parameters
     ----------
     obj : `Any`
@@ -241,25 +266,47 @@ def my_to_json(obj: Any) -> str:
     `str`
         JSON data.
     """
-    def __json_serialize(obj_: Any) -> dict:
-        if isinstance(obj_, JsonSerializable):
-            my_class_name = (obj_.__module__, obj_.__class__.__name__)
-            return obj_.get_attributes() | {"__type__": my_class_name}
-        elif isinstance(obj_, np.ndarray):
-            return obj_.tolist()
-        else:
-            return obj_
+    if orjson is not None:
+        return my_to_json_bytes(obj).decode("utf-8")
+
+    return json.dumps(obj, default=_json_serialize_default)
+
+
+def my_to_json_bytes(obj: Any) -> bytes:
+    """
+    Serializes a given object to UTF-8 encoded JSON data.
+
+    Uses `orjson <https://github.com/ijl/orjson>`_ if available --
+    falls back to the Python standard library otherwise.
+
+    Parameters
+    ----------
+    obj : `Any`
+        Object to be serialized.
+
+    Returns
+    -------
+    `bytes`
+        UTF-8 encoded JSON data.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_serialize_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY |
+                            orjson.OPT_NON_STR_KEYS)
 
-    return json.dumps(obj, default=__json_serialize)
+    return json.dumps(obj, default=_json_serialize_default).encode("utf-8")
 
 
-def my_load_from_json(data: str) -> Any:
+def my_load_from_json(data: Union[str, bytes]) -> Any:
     """
     Loads (i.e. deserializes) an object from given JSON data.
 
+    Uses `orjson <https://github.com/ijl/orjson>`_ if available --
+    falls back to the Python standard library otherwise.
+
     Parameters
     ----------
-    data : `str`
+    data : `str` or `bytes`
         JSON data.
 
     Returns
@@ -280,6 +327,18 @@ def my_load_from_json(data: str) -> Any:
             return cls(**obj)
         return obj
 
+    if orjson is not None:
+        def __walk(item: Any) -> Any:
+            if isinstance(item, dict):
+                return __object_hook({key: __walk(value)
+                                      for key, value in item.items()})
+            elif isinstance(item, list):
+                return [__walk(value) for value in item]
+            else:
+                return item
+
+        return __walk(orjson.loads(data))
+
     return json.loads(data, object_hook=__object_hook)
 
 
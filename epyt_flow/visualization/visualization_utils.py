@@ -3,7 +3,7 @@ Module provides helper functions and data management classes for visualizing
 scenarios.
 """
 import inspect
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Union, List, Tuple
 
 import matplotlib as mpl
@@ -11,9 +11,17 @@ import networkx.drawing.nx_pylab as nxp
 import numpy as np
 from scipy.interpolate import CubicSpline
 
+from . import _spline_kernel
 from ..serialization import COLOR_SCHEMES_ID, JsonSerializable, serializable
 from ..simulation.scada.scada_data import ScadaData
 
+# Parameters accepted by the networkx drawing functions -- resolved once
+# at import time since inspect.signature is too slow for per-frame calls
+_NODE_DRAW_PARAMS = frozenset(
+    inspect.signature(nxp.draw_networkx_nodes).parameters)
+_EDGE_DRAW_PARAMS = frozenset(
+    inspect.signature(nxp.draw_networkx_edges).parameters)
+
 # Selection of functions for processing visualization data
 stat_funcs = {
     'mean': np.mean,
@@ -21,6 +29,192 @@ stat_funcs = {
     'max': np.max
 }
 
+# Cache of spline resampling matrices keyed by (steps, num_inter_frames)
+_spline_resample_matrices = {}
+
+# Minimum number of nodes/edges before the interpolation is offloaded to
+# the Numba kernel (if Numba is installed)
+_NUMBA_SPLINE_MIN_COLUMNS = 1000
+
+
+def _spline_resample_matrix(steps: int, num_inter_frames: int) -> np.ndarray:
+    """
+    Returns the weight matrix `W` that resamples `steps` uniformly spaced
+    frames to `num_inter_frames` frames by cubic-spline interpolation --
+    i.e. `W @ y` equals `CubicSpline(x_axis, y, axis=0)(new_x_axis)` for
+    any set of frame columns `y`.
+
+    Since spline interpolation is linear in the data, `W` is obtained by
+    interpolating the columns of the identity matrix. The matrix only
+    depends on the two frame counts and is cached across calls.
+
+    Parameters
+    ----------
+    steps : `int`
+        Number of frames before interpolation.
+    num_inter_frames : `int`
+        The number of total frames after interpolation.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Resampling matrix of shape (num_inter_frames, steps).
+    """
+    key = (steps, num_inter_frames)
+    if key not in _spline_resample_matrices:
+        x_axis = np.linspace(0, steps - 1, steps)
+        new_x_axis = np.linspace(0, steps - 1, num_inter_frames)
+
+        cs = CubicSpline(x_axis, np.eye(steps), axis=0)
+        _spline_resample_matrices[key] = cs(new_x_axis).astype(np.float32)
+
+    return _spline_resample_matrices[key]
+
+
+def _append_frame(frames: Optional[np.ndarray], num_frames: int,
+                  values) -> np.ndarray:
+    """
+    Appends one frame of per-node/per-edge values to a preallocated 2-D
+    frame buffer, growing the buffer geometrically (like `list`) when its
+    capacity is exhausted.
+
+    Parameters
+    ----------
+    frames : :class:`~numpy.ndarray` or None
+        Frame buffer of shape (capacity, num_columns) -- None if no frame
+        has been added yet.
+    num_frames : `int`
+        Number of rows of the buffer that are in use.
+    values : array_like
+        Values of the new frame.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        The (possibly reallocated) frame buffer.
+    """
+    if frames is None:
+        # The frames only feed matplotlib's colormap/line-width
+        # normalization, so single precision suffices and halves the
+        # buffer's memory footprint
+        frames = np.empty((4, len(values)), dtype=np.float32)
+    elif num_frames == frames.shape[0]:
+        grown = np.empty((2 * num_frames, frames.shape[1]),
+                         dtype=frames.dtype)
+        grown[:num_frames] = frames
+        frames = grown
+
+    frames[num_frames] = values
+    return frames
+
+
+def _process_frame_values(values: np.ndarray, statistic: str,
+                          pit: Optional[int],
+                          intervals: Optional[Union[int, List[Union[int,
+                                                                    float]]]]
+                          ) -> np.ndarray:
+    """
+    Reduces raw per-time-step values to a single frame by the given
+    statistic and (optionally) groups the result into intervals -- the
+    shared core of the `add_frame` methods of
+    :class:`~epyt_flow.visualization.visualization_utils.JunctionObject`
+    and :class:`~epyt_flow.visualization.visualization_utils.EdgeObject`.
+
+    Parameters
+    ----------
+    values : :class:`~numpy.ndarray`
+        The node/edge values over time as extracted from the scada data.
+    statistic : `str`
+        The statistic to calculate for the data. Can be 'mean', 'min',
+        'max' or 'time_step'.
+    pit : `int`
+        The point in time for the 'time_step' statistic.
+    intervals : `int`, `list[int]` or `list[float]`
+        If provided, the data will be grouped into intervals. It can be an
+        integer specifying the number of groups or a list of boundary
+        points.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Per-node/per-edge values of the new frame.
+
+    Raises
+    ------
+    ValueError
+        If interval, pit or statistic is not correctly provided.
+    """
+    stat_func = stat_funcs.get(statistic)
+    if stat_func is not None:
+        stat_values = stat_func(values, axis=0)
+    elif statistic == 'time_step':
+        if not pit and pit != 0:
+            raise ValueError(
+                'Please input point in time (pit) parameter when selecting'
+                ' time_step statistic')
+        stat_values = values[pit]
+    else:
+        raise ValueError(
+            'Statistic parameter must be mean, min, max or time_step')
+
+    if intervals is None:
+        pass
+    elif isinstance(intervals, (int, float)):
+        # Uniform bins -- the bin index follows directly from the
+        # bin width, no binary search needed
+        num_bins = int(intervals)
+        vmin = stat_values.min()
+        bin_width = (stat_values.max() - vmin) / num_bins
+        if bin_width == 0:
+            stat_values = np.zeros(stat_values.shape, dtype=np.intp)
+        else:
+            stat_values = np.clip(
+                ((stat_values - vmin) / bin_width).astype(np.intp),
+                0, num_bins - 1)
+    elif isinstance(intervals, list):
+        stat_values = np.digitize(stat_values, intervals) - 1
+    else:
+        raise ValueError(
+            'Intervals must be either number of groups or list of interval'
+            ' boundary points')
+
+    return stat_values
+
+
+def _resample_frames(frames: np.ndarray, num_inter_frames: int) -> np.ndarray:
+    """
+    Resamples the given frames to `num_inter_frames` frames by
+    cubic-spline interpolation.
+
+    For large networks, the per-column interpolation is offloaded to a
+    parallel Numba kernel if Numba is installed -- otherwise (and for
+    small networks) the cached resampling matrix is applied.
+
+    Parameters
+    ----------
+    frames : :class:`~numpy.ndarray`
+        Frame data of shape (steps, num_columns).
+    num_inter_frames : `int`
+        The number of total frames after interpolation.
+
+    Returns
+    -------
+    :class:`~numpy.ndarray`
+        Resampled frames of shape (num_inter_frames, num_columns).
+    """
+    # The interpolated values only feed matplotlib's colormap/line-width
+    # normalization, so single precision is more than sufficient and
+    # halves the memory traffic
+    frames = np.ascontiguousarray(frames, dtype=np.float32)
+    steps, num_cols = frames.shape
+
+    if _spline_kernel.NUMBA_AVAILABLE and num_cols >= _NUMBA_SPLINE_MIN_COLUMNS:
+        new_x_axis = np.linspace(0, steps - 1, num_inter_frames,
+                                 dtype=np.float32)
+        return _spline_kernel.resample_cubic(frames, new_x_axis)
+
+    return _spline_resample_matrix(steps, num_inter_frames) @ frames
+
 
 @dataclass
 class JunctionObject:
@@ -40,19 +234,35 @@ class JunctionObject:
         is used.
     node_size : `int`, default = 10
         The size of each node.
-    node_color : `str` or `list`, default = 'k'
-        If `string`: the color for all nodes, if `list`: a list of lists
-        containing a numerical value for each node per frame, which will be
-        used for coloring.
+    node_color : `str` or :class:`~numpy.ndarray`, default = 'k'
+        If `string`: the color for all nodes, otherwise: a 2-D array of
+        shape (frames, nodes) containing a numerical value for each node
+        per frame, which will be used for coloring.
     interpolated : `bool`, default = False
         Set to True, if node_colors are interpolated for smoother animation.
+    vmin : `float` or None
+        Minimum of all node color values -- set by
+        :func:`~epyt_flow.visualization.visualization_utils.JunctionObject.add_frame`.
+    vmax : `float` or None
+        Maximum of all node color values -- set by
+        :func:`~epyt_flow.visualization.visualization_utils.JunctionObject.add_frame`.
+    cmap : `str` or None
+        Colormap used for drawing the node colors.
+    node_color_inter : :class:`~numpy.ndarray` or None
+        Interpolated node color frames -- set by
+        :func:`~epyt_flow.visualization.visualization_utils.JunctionObject.interpolate`.
     """
     nodelist: list
     pos: dict
     node_shape: mpl.path.Path = None
     node_size: int = 10
-    node_color: Union[str, list] = 'k'
+    node_color: Union[str, np.ndarray] = 'k'
     interpolated: bool = False
+    vmin: Optional[float] = None
+    vmax: Optional[float] = None
+    cmap: Optional[str] = None
+    node_color_inter: Optional[np.ndarray] = None
+    _initialized: bool = field(default=False, init=False, repr=False)
 
     def add_frame(self, statistic: str, values: np.ndarray,
                   pit: int, intervals: Union[int, List[Union[int, float]]]):
@@ -79,42 +289,28 @@ class JunctionObject:
             If interval, pit or statistic is not correctly provided.
 
         """
-        if statistic in stat_funcs:
-            stat_values = stat_funcs[statistic](values, axis=0)
-        elif statistic == 'time_step':
-            if not pit and pit != 0:
-                raise ValueError(
-                    'Please input point in time (pit) parameter when selecting'
-                    ' time_step statistic')
-            stat_values = np.take(values, pit, axis=0)
-        else:
-            raise ValueError(
-                'Statistic parameter must be mean, min, max or time_step')
-
-        if intervals is None:
-            pass
-        elif isinstance(intervals, (int, float)):
-            interv = np.linspace(stat_values.min(), stat_values.max(),
-                                 intervals + 1)
-            stat_values = np.digitize(stat_values, interv) - 1
-        elif isinstance(intervals, list):
-            stat_values = np.digitize(stat_values, intervals) - 1
-        else:
-            raise ValueError(
-                'Intervals must be either number of groups or list of interval'
-                ' boundary points')
+        stat_values = _process_frame_values(values, statistic, pit, intervals)
 
-        sorted_values = [v for _, v in zip(self.nodelist, stat_values)]
+        # The scada data covers all nodes (junctions followed by tanks and
+        # reservoirs) while this object only draws its own nodelist -- keep
+        # the leading entries so frame length, vmin and vmax match the
+        # drawn nodes
+        stat_values = stat_values[:len(self.nodelist)]
 
-        if isinstance(self.node_color, str):
+        if not self._initialized:
             # First run of this method
-            self.node_color = []
-            self.vmin = min(sorted_values)
-            self.vmax = max(sorted_values)
-
-        self.node_color.append(sorted_values)
-        self.vmin = min(*sorted_values, self.vmin)
-        self.vmax = max(*sorted_values, self.vmin)
+            self._initialized = True
+            self._frames = None
+            self._num_frames = 0
+            self.vmin = float('inf')
+            self.vmax = float('-inf')
+
+        self._frames = _append_frame(self._frames, self._num_frames,
+                                     stat_values)
+        self._num_frames += 1
+        self.node_color = self._frames[:self._num_frames]
+        self.vmin = min(self.vmin, float(stat_values.min()))
+        self.vmax = max(self.vmax, float(stat_values.max()))
 
     def get_frame(self, frame_number: int = 0):
         """
@@ -135,24 +331,18 @@ class JunctionObject:
             for :class:`~networkx.drawing.nx_pylab.draw_networkx_nodes()`.
         """
 
-        attributes = vars(self).copy()
+        valid_params = {
+            key: value for key, value in vars(self).items()
+            if key in _NODE_DRAW_PARAMS and value is not None
+        }
 
-        if not isinstance(self.node_color, str):
+        if self._initialized:
             if self.interpolated:
-                if frame_number > len(self.node_color_inter):
-                    frame_number = -1
-                attributes['node_color'] = self.node_color_inter[frame_number]
+                frames = self.node_color_inter
             else:
-                if frame_number > len(self.node_color):
-                    frame_number = -1
-                attributes['node_color'] = self.node_color[frame_number]
-
-        sig = inspect.signature(nxp.draw_networkx_nodes)
-
-        valid_params = {
-            key: value for key, value in attributes.items()
-            if key in sig.parameters and value is not None
-        }
+                frames = self.node_color
+            idx = frame_number if 0 <= frame_number < len(frames) else -1
+            valid_params['node_color'] = frames[idx]
 
         return valid_params
 
@@ -165,20 +355,12 @@ class JunctionObject:
         num_inter_frames : `int`
             The number of total frames after interpolation.
         """
-        if isinstance(self.node_color, str) or len(self.node_color) <= 1:
+        if not self._initialized or len(self.node_color) <= 1:
             return
 
-        tmp_node_color = np.array(self.node_color)
-        steps, num_nodes = tmp_node_color.shape
-
-        x_axis = np.linspace(0, steps - 1, steps)
-        new_x_axis = np.linspace(0, steps - 1, num_inter_frames)
-
-        self.node_color_inter = np.zeros(((len(new_x_axis)), num_nodes))
-
-        for node in range(num_nodes):
-            cs = CubicSpline(x_axis, tmp_node_color[:, node])
-            self.node_color_inter[:, node] = cs(new_x_axis)
+        tmp_node_color = np.asarray(self.node_color)
+        self.node_color_inter = _resample_frames(tmp_node_color,
+                                                 num_inter_frames)
 
         self.interpolated = True
 
@@ -208,17 +390,64 @@ class EdgeObject:
     pos : `dict`
         A dictionary mapping pipes to their coordinates in the correct format
         for drawing.
-    edge_color : `str` or `list`, default = 'k'
-        If `string`: the color for all edges, if `list`: a list of lists
-        containing a numerical value for each edge per frame, which will be
-        used for coloring.
+    edge_color : `str` or :class:`~numpy.ndarray`, default = 'k'
+        If `string`: the color for all edges, otherwise: a 2-D array of
+        shape (frames, edges) containing a numerical value for each edge
+        per frame, which will be used for coloring.
     interpolated : `dict`, default = {}
         Filled with interpolated frames if interpolation method is called.
+    edge_vmin : `float` or None
+        Minimum of all edge color values -- set by
+        :func:`~epyt_flow.visualization.visualization_utils.EdgeObject.add_frame`.
+    edge_vmax : `float` or None
+        Maximum of all edge color values -- set by
+        :func:`~epyt_flow.visualization.visualization_utils.EdgeObject.add_frame`.
+    edge_cmap : :class:`~matplotlib.colors.Colormap` or None
+        Colormap used for drawing the edge colors.
     """
     edgelist: list
     pos: dict
-    edge_color: Union[str, list] = 'k'
-    interpolated = {}
+    edge_color: Union[str, np.ndarray] = 'k'
+    edge_vmin: Optional[float] = None
+    edge_vmax: Optional[float] = None
+    edge_cmap: Optional[mpl.colors.Colormap] = None
+    interpolated: dict = field(default_factory=dict)
+    _diameter_cache: Optional[np.ndarray] = field(default=None, init=False,
+                                                  repr=False)
+    _initialized: bool = field(default=False, init=False, repr=False)
+
+    def __append_color_frame(self, values) -> None:
+        """
+        Appends one frame of edge color values to the color frame buffer
+        and updates the running color extremes.
+
+        Parameters
+        ----------
+        values : array_like
+            Color values of the new frame.
+        """
+        self._color_frames = _append_frame(self._color_frames,
+                                           self._num_color_frames, values)
+        self._num_color_frames += 1
+        self.edge_color = self._color_frames[:self._num_color_frames]
+
+        row = self._color_frames[self._num_color_frames - 1]
+        self.edge_vmin = min(self.edge_vmin, float(row.min()))
+        self.edge_vmax = max(self.edge_vmax, float(row.max()))
+
+    def __append_width_frame(self, values) -> None:
+        """
+        Appends one frame of edge width values to the width frame buffer.
+
+        Parameters
+        ----------
+        values : array_like
+            Width values of the new frame.
+        """
+        self._width_frames = _append_frame(self._width_frames,
+                                           self._num_width_frames, values)
+        self._num_width_frames += 1
+        self.width = self._width_frames[:self._num_width_frames]
 
     def rescale_widths(self, line_widths: Tuple[int] = (1, 2)):
         """
@@ -239,14 +468,13 @@ class EdgeObject:
                 'Please call add_frame with edge_param=width before rescaling'
                 ' the widths.')
 
-        vmin = min(min(l) for l in self.width)
-        vmax = max(max(l) for l in self.width)
+        widths = self._width_frames[:self._num_width_frames]
+        vmin = widths.min()
+        vmax = widths.max()
 
-        tmp = []
-        for il in self.width:
-            tmp.append(
-                self.__rescale(il, line_widths, values_min_max=(vmin, vmax)))
-        self.width = tmp
+        scale = line_widths[1] - line_widths[0]
+        widths[:] = line_widths[0] + (widths - vmin) * (scale / (vmax - vmin))
+        self.width = widths
 
     def add_frame(
             self, topology, edge_param: str,
@@ -289,9 +517,14 @@ class EdgeObject:
         """
         if edge_param == 'edge_width' and not hasattr(self, 'width'):
             self.width = []
+            self._width_frames = None
+            self._num_width_frames = 0
         elif edge_param == 'edge_color':
-            if isinstance(self.edge_color, str):
+            if not self._initialized:
+                self._initialized = True
                 self.edge_color = []
+                self._color_frames = None
+                self._num_color_frames = 0
                 self.edge_vmin = float('inf')
                 self.edge_vmax = float('-inf')
 
@@ -302,57 +535,30 @@ class EdgeObject:
         elif parameter == 'custom_data':
             values = scada_data
         elif parameter == 'diameter':
-            value_dict = {
-                link[0]: topology.get_link_info(link[0])['diameter'] for
-                link in topology.get_all_links()}
-            sorted_values = [value_dict[x[0]] for x in
-                             topology.get_all_links()]
+            if self._diameter_cache is None:
+                # Pipe diameters are static across frames -- query the
+                # topology only once
+                self._diameter_cache = np.array(
+                    [topology.get_link_info(link[0])['diameter']
+                     for link in topology.get_all_links()])
+            sorted_values = self._diameter_cache
 
             if edge_param == 'edge_width':
-                self.width.append(sorted_values)
+                self.__append_width_frame(sorted_values)
             else:
-                self.edge_color.append(sorted_values)
-                self.edge_vmin = min(*sorted_values, self.edge_vmin)
-                self.edge_vmax = max(*sorted_values, self.edge_vmax)
+                self.__append_color_frame(sorted_values)
 
             return
         else:
             raise ValueError('Parameter must be flow_rate, link_quality, '
                              'diameter or custom_data.')
 
-        if statistic in stat_funcs:
-            stat_values = stat_funcs[statistic](values, axis=0)
-        elif statistic == 'time_step':
-            if not pit and pit != 0:
-                raise ValueError(
-                    'Please input point in time (pit) parameter when selecting'
-                    ' time_step statistic')
-            stat_values = np.take(values, pit, axis=0)
-        else:
-            raise ValueError(
-                'Statistic parameter must be mean, min, max or time_step')
-
-        if intervals is None:
-            pass
-        elif isinstance(intervals, (int, float)):
-            interv = np.linspace(stat_values.min(), stat_values.max(),
-                                 intervals + 1)
-            stat_values = np.digitize(stat_values, interv) - 1
-        elif isinstance(intervals, list):
-            stat_values = np.digitize(stat_values, intervals) - 1
-        else:
-            raise ValueError(
-                'Intervals must be either number of groups or list of interval'
-                ' boundary points')
-
-        sorted_values = list(stat_values)
+        stat_values = _process_frame_values(values, statistic, pit, intervals)
 
         if edge_param == 'edge_width':
-            self.width.append(sorted_values)
+            self.__append_width_frame(stat_values)
         else:
-            self.edge_color.append(sorted_values)
-            self.edge_vmin = min(*sorted_values, self.edge_vmin)
-            self.edge_vmax = max(*sorted_values, self.edge_vmax)
+            self.__append_color_frame(stat_values)
 
     def get_frame(self, frame_number: int = 0):
         """
@@ -372,35 +578,26 @@ class EdgeObject:
             A dictionary containing all attributes that function as parameters
             for :class:`~networkx.drawing.nx_pylab.draw_networkx_edges()`.
         """
-        attributes = vars(self).copy()
-
-        if not isinstance(self.edge_color, str):
-            if 'edge_color' in self.interpolated.keys():
-                if frame_number > len(self.interpolated['edge_color']):
-                    frame_number = -1
-                attributes['edge_color'] = self.interpolated['edge_color'][
-                    frame_number]
+        valid_params = {
+            key: value for key, value in vars(self).items()
+            if key in _EDGE_DRAW_PARAMS and value is not None
+        }
+
+        if self._initialized:
+            if 'edge_color' in self.interpolated:
+                frames = self.interpolated['edge_color']
             else:
-                if frame_number > len(self.edge_color):
-                    frame_number = -1
-                attributes['edge_color'] = self.edge_color[frame_number]
+                frames = self.edge_color
+            idx = frame_number if 0 <= frame_number < len(frames) else -1
+            valid_params['edge_color'] = frames[idx]
 
         if hasattr(self, 'width'):
-            if 'width' in self.interpolated.keys():
-                if frame_number > len(self.interpolated['width']):
-                    frame_number = -1
-                attributes['width'] = self.interpolated['width'][frame_number]
+            if 'width' in self.interpolated:
+                frames = self.interpolated['width']
             else:
-                if frame_number > len(self.width):
-                    frame_number = -1
-                attributes['width'] = self.width[frame_number]
-
-        sig = inspect.signature(nxp.draw_networkx_edges)
-
-        valid_params = {
-            key: value for key, value in attributes.items()
-            if key in sig.parameters and value is not None
-        }
+                frames = self.width
+            idx = frame_number if 0 <= frame_number < len(frames) else -1
+            valid_params['width'] = frames[idx]
 
         return valid_params
 
@@ -421,19 +618,9 @@ class EdgeObject:
             if isinstance(inter_target, str) or len(inter_target) <= 1:
                 continue
 
-            tmp_target = np.array(inter_target)
-            steps, num_edges = tmp_target.shape
-
-            x_axis = np.linspace(0, steps - 1, steps)
-            new_x_axis = np.linspace(0, steps - 1, num_inter_frames)
-
-            vals_inter = np.zeros(((len(new_x_axis)), num_edges))
-
-            for edge in range(num_edges):
-                cs = CubicSpline(x_axis, tmp_target[:, edge])
-                vals_inter[:, edge] = cs(new_x_axis)
-
-            self.interpolated[name] = vals_inter
+            tmp_target = np.asarray(inter_target)
+            self.interpolated[name] = _resample_frames(tmp_target,
+                                                       num_inter_frames)
 
     def add_attributes(self, attributes: dict):
         """
@@ -447,48 +634,6 @@ class EdgeObject:
         for key, value in attributes.items():
             setattr(self, key, value)
 
-    @staticmethod
-    def __rescale(values: Union[np.ndarray, list],
-                  scale_min_max: Union[List, Tuple[int]],
-                  values_min_max: Union[List, Tuple[int, int]] = None) -> List:
-        """
-        Rescales the given values to a new range.
-
-        This method rescales an array of values to fit within a specified
-        minimum and maximum scale range. Optionally, the minimum and maximum
-        of the input values can be manually provided; otherwise, they are
-        automatically determined from the data.
-
-        Parameters
-        ----------
-        values : :class:`~np.ndarray` or `list`
-            The array of numerical values to be rescaled.
-        scale_min_max : `list` or `tuple`
-            A list or tuple containing two elements: the minimum and maximum
-            values of the desired output range.
-        values_min_max : `list` or `tuple`, optional
-            A list or tuple containing two elements: the minimum and maximum
-            values of the input data. If not provided, they are computed from
-            the input `values`. Default is `None`.
-
-        Returns
-        -------
-        rescaled_values : `list`
-            A list of values rescaled to the range specified by
-            `scale_min_max`.
-        """
-        if not values_min_max:
-            min_val, max_val = min(values), max(values)
-        else:
-            min_val, max_val = values_min_max
-        scale = scale_min_max[1] - scale_min_max[0]
-
-        def range_map(x):
-            return scale_min_max[0] + (x - min_val) / (
-                    max_val - min_val) * scale
-
-        return [range_map(x) for x in values]
-
 
 @serializable(COLOR_SCHEMES_ID, ".epyt_flow_color_scheme")
 class ColorScheme(JsonSerializable):
@@ -496,6 +641,12 @@ class ColorScheme(JsonSerializable):
     A class containing the color scheme for the
     :class:`~epyt_flow.visualization.ScenarioVisualizer`.
     """
+
+    # Serialized attributes -- the schema is fixed, so there is no need
+    # to introspect the instance dict on every serialization
+    _SERIALIZED_ATTRS = ('pipe_color', 'node_color', 'pump_color',
+                         'tank_color', 'reservoir_color', 'valve_color')
+
     def __init__(self, pipe_color, node_color, pump_color, tank_color,
                  reservoir_color, valve_color):
         self.pipe_color = pipe_color
@@ -514,10 +665,7 @@ class ColorScheme(JsonSerializable):
         -------
         attr : A dictionary containing all attributes to be serialized.
         """
-        attr = {
-            k: v for k, v in self.__dict__.items()
-            if not (k.startswith("__") or k.startswith("_")) and not callable(v)
-        }
+        attr = {k: getattr(self, k) for k in self._SERIALIZED_ATTRS}
         return super().get_attributes() | attr
 
 
@@ -9,6 +9,7 @@ import numpy as np
 from epyt_flow.data.benchmarks import load_leakdb_scenarios
 from epyt_flow.data.networks import load_hanoi, load_ctown
 from epyt_flow.simulation import ScenarioSimulator
+from epyt_flow.utils import to_seconds
 from epyt_flow.visualization import ScenarioVisualizer, epanet_colors, epyt_flow_colors
 
 SHOW_PLOTS = False
@@ -35,6 +36,25 @@ def test_animation(setup_simulator):
         vis.show_animation(return_animation=True)
 
 
+def test_node_animation():
+    # Regression test: the pressure data covers all nodes while only
+    # junctions are colored -- drawing must not fail on networks with
+    # tanks/reservoirs
+    network_config = load_hanoi()
+    wdn = ScenarioSimulator(scenario_config=network_config)
+    wdn.set_general_parameters(simulation_duration=to_seconds(days=2))
+    vis = ScenarioVisualizer(wdn)
+    vis.color_nodes(parameter='pressure', statistic='time_step', pit=(1, 50),
+                    colormap='Blues')
+    # Renders the first frame eagerly -- FuncAnimation alone draws lazily
+    vis.show_plot(suppress_plot=True)
+    if SHOW_PLOTS:
+        vis.show_animation()
+    else:
+        vis.show_animation(return_animation=True)
+    wdn.close()
+
+
 def test_animation_with_colorbar(setup_simulator):
     vis = ScenarioVisualizer(setup_simulator)
     vis.color_links(parameter='flow_rate', statistic='time_step', pit=(1, 200),